@@ -10,72 +10,196 @@ of diagonal lines with configurable colors and transparency effects.
 import random
 import colorsys
 import argparse
-import math
+import os
+import functools
+import multiprocessing as mp
 from pathlib import Path
-import svgwrite
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain NumPy
+    njit = None
+
+
+# Static SVG fragments, formatted directly instead of going through svgwrite
+_SVG_HEADER = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="{w}" height="{h}">\n'
+    '<rect x="0" y="0" width="{w}" height="{h}" fill="white"/>\n'
+)
+_SVG_FOOTER = '</svg>\n'
+# Output is handed to os.write in blocks of about this many characters
+_WRITE_BLOCK = 1 << 16
+
+
+def _randint_from(u, low, high):
+    """Map a uniform draw in [0, 1) onto the integers low..high inclusive"""
+    if high < low:
+        raise ValueError(f"empty range for _randint_from: {low}..{high}")
+    return low + int(u * (high - low + 1))
+
+
+def _hsb_int_to_hex(h, s, v):
+    """Convert p5.js style HSB integers to an RGB hex string
+    
+    Works directly in integer space (H=0-360, S=0-100, B=0-100) and
+    scales straight to 0-255, with no float round trip.
+    """
+    h %= 360
+    region = h // 60
+    remainder = h - region * 60
+    
+    # v * (1 - s), v * (1 - s * f) and v * (1 - s * (1 - f)),
+    # with f = remainder / 60, all scaled to 0-255
+    v255 = v * 255
+    p = v255 * (100 - s) // 10000
+    q = v255 * (6000 - s * remainder) // 600000
+    t = v255 * (6000 - s * (60 - remainder)) // 600000
+    v = v255 // 100
+    
+    r, g, b = (
+        (v, t, p),  # red -> yellow
+        (q, v, p),  # yellow -> green
+        (p, v, t),  # green -> cyan
+        (p, q, v),  # cyan -> blue
+        (t, p, v),  # blue -> magenta
+        (v, p, q),  # magenta -> red
+    )[region]
+    return '#%02x%02x%02x' % (r, g, b)
+
+
+def _fill_diagonals_loop(grid_y, tile_size, toggles, out_coords):
+    """Fill out_coords with the eight endpoint coordinates of every tile in
+    grid row grid_y
+    
+    Written as a plain loop so numba can compile it.
+    """
+    half_tile = tile_size / 2
+    top = grid_y * tile_size
+    bottom = top + tile_size
+    for grid_x in range(toggles.shape[0]):
+        pos_x = grid_x * tile_size
+        
+        # Pattern 0 (\) runs top to bottom, pattern 1 (/) bottom to top
+        if toggles[grid_x]:
+            start_y = bottom
+            end_y = top
+        else:
+            start_y = top
+            end_y = bottom
+        
+        out_coords[grid_x, 0] = pos_x
+        out_coords[grid_x, 1] = start_y
+        out_coords[grid_x, 2] = pos_x + half_tile
+        out_coords[grid_x, 3] = end_y
+        out_coords[grid_x, 4] = pos_x + half_tile
+        out_coords[grid_x, 5] = start_y
+        out_coords[grid_x, 6] = pos_x + tile_size
+        out_coords[grid_x, 7] = end_y
+
+
+def _fill_diagonals_numpy(grid_y, tile_size, toggles, out_coords):
+    """Vectorized equivalent of _fill_diagonals_loop for when numba is missing"""
+    half_tile = tile_size / 2
+    top = grid_y * tile_size
+    bottom = top + tile_size
+    pos_x = np.arange(toggles.shape[0]) * tile_size
+    
+    flipped = toggles.astype(bool)
+    start_y = np.where(flipped, bottom, top)
+    end_y = np.where(flipped, top, bottom)
+    out_coords[:, 0] = pos_x
+    out_coords[:, 1] = start_y
+    out_coords[:, 2] = pos_x + half_tile
+    out_coords[:, 3] = end_y
+    out_coords[:, 4] = pos_x + half_tile
+    out_coords[:, 5] = start_y
+    out_coords[:, 6] = pos_x + tile_size
+    out_coords[:, 7] = end_y
+
+
+if njit is not None:
+    _fill_diagonals = njit(cache=True)(_fill_diagonals_loop)
+else:
+    _fill_diagonals = _fill_diagonals_numpy
 
 
 class DiagonalPatternGenerator:
-    def __init__(self, width=600, height=600):
+    def __init__(self, width=600, height=600, seed=None):
         self.width = width
         self.height = height
-        
-
-        
+        self.rng = np.random.default_rng(seed)
+    
     def hsb_to_rgb(self, h, s, b):
         """Convert HSB (p5.js style) to RGB hex string"""
+        if isinstance(h, int) and isinstance(s, int) and isinstance(b, int):
+            return _hsb_int_to_hex(h, s, b)
+        
+        # Fractional HSB goes through colorsys
         # p5.js HSB: H=0-360, S=0-100, B=0-100
         # Python HSV: H=0-1, S=0-1, V=0-1
-        h_norm = (h % 360) / 360.0
-        s_norm = s / 100.0
-        v_norm = b / 100.0
-        
-        rgb = colorsys.hsv_to_rgb(h_norm, s_norm, v_norm)
+        rgb = colorsys.hsv_to_rgb((h % 360) / 360.0, s / 100.0, b / 100.0)
         return '#{:02x}{:02x}{:02x}'.format(
             int(rgb[0] * 255),
             int(rgb[1] * 255),
             int(rgb[2] * 255)
         )
     
+    def generate_random_colors(self, count):
+        """Generate several random colors with good saturation and brightness"""
+        # Every hue, saturation and brightness in a single Generator call
+        colors = []
+        for u_hue, u_sat, u_bright in self.rng.random((count, 3)).tolist():
+            hue = _randint_from(u_hue, 0, 360)
+            saturation = _randint_from(u_sat, 60, 100)  # Good saturation
+            brightness = _randint_from(u_bright, 40, 90)  # Avoid too dark or too bright
+            colors.append(_hsb_int_to_hex(hue, saturation, brightness))
+        return colors
+    
     def generate_random_color(self):
         """Generate a random color with good saturation and brightness"""
-        hue = random.randint(0, 360)
-        saturation = random.randint(60, 100)  # Good saturation
-        brightness = random.randint(40, 90)   # Avoid too dark or too bright
-        return self.hsb_to_rgb(hue, saturation, brightness)
+        return self.generate_random_colors(1)[0]
 
     
     def create_diagonal_pattern(self, dwg, tile_count, stroke_weight, random_seed=None, 
                               color_left=None, color_right=None):
-        """Create the diagonal pattern based on script.js logic"""
+        """Create the diagonal pattern based on script.js logic
+        
+        Adds the pattern as line elements to dwg, an svgwrite.Drawing owned
+        by the caller.  This is the supported way to combine a pattern with
+        other svgwrite content; generate_pattern and render_pattern write
+        raw SVG instead and don't need svgwrite at all.
+        """
         
         if random_seed is not None:
-            random.seed(random_seed)
+            self.rng = np.random.default_rng(random_seed)
         
         tile_size = self.width / tile_count
         
+        # Line factories with the shared stroke bound once, so each call only
+        # passes endpoints
+        make_left = functools.partial(dwg.line, stroke=color_left, stroke_width=stroke_weight)
+        make_right = functools.partial(dwg.line, stroke=color_right, stroke_width=stroke_weight)
+        
         for grid_y in range(tile_count):
+            # Random toggle between two diagonal patterns (like script.js),
+            # drawn a row at a time the same way as _iter_paths
+            toggles = self.rng.integers(0, 2, size=tile_count, dtype=np.uint8).tolist()
             for grid_x in range(tile_count):
                 pos_x = tile_size * grid_x
                 pos_y = tile_size * grid_y
                 
-                # Random toggle between two diagonal patterns (like script.js)
-                toggle = random.randint(0, 1)
-                
-                if toggle == 0:
+                if toggles[grid_x] == 0:
                     # Pattern 0: Left-leaning diagonals (\)
                     # Two line segments forming the pattern
-                    line1 = dwg.line(
+                    line1 = make_left(
                         start=(pos_x, pos_y),
-                        end=(pos_x + tile_size / 2, pos_y + tile_size),
-                        stroke=color_left,
-                        stroke_width=stroke_weight
+                        end=(pos_x + tile_size / 2, pos_y + tile_size)
                     )
-                    line2 = dwg.line(
+                    line2 = make_left(
                         start=(pos_x + tile_size / 2, pos_y),
-                        end=(pos_x + tile_size, pos_y + tile_size),
-                        stroke=color_left,
-                        stroke_width=stroke_weight
+                        end=(pos_x + tile_size, pos_y + tile_size)
                     )
                     dwg.add(line1)
                     dwg.add(line2)
@@ -83,50 +207,132 @@ class DiagonalPatternGenerator:
                 else:
                     # Pattern 1: Right-leaning diagonals (/)
                     # Two line segments forming the pattern
-                    line1 = dwg.line(
+                    line1 = make_right(
                         start=(pos_x, pos_y + tile_size),
-                        end=(pos_x + tile_size / 2, pos_y),
-                        stroke=color_right,
-                        stroke_width=stroke_weight
+                        end=(pos_x + tile_size / 2, pos_y)
                     )
-                    line2 = dwg.line(
+                    line2 = make_right(
                         start=(pos_x + tile_size / 2, pos_y + tile_size),
-                        end=(pos_x + tile_size, pos_y),
-                        stroke=color_right,
-                        stroke_width=stroke_weight
+                        end=(pos_x + tile_size, pos_y)
                     )
                     dwg.add(line1)
                     dwg.add(line2)
     
-    def generate_pattern(self, filename, tile_count=20, stroke_weight=8, random_seed=None):
-        """Generate a complete SVG pattern"""
+    def _iter_paths(self, tile_count, stroke_weight, random_seed=None,
+                    color_left=None, color_right=None):
+        """Yield the diagonal pattern as two raw SVG path elements, in chunks
         
-        # Generate two random colors for this pattern
-        color_left = self.generate_random_color()
-        color_right = self.generate_random_color()
+        Same logic as create_diagonal_pattern, but every left-leaning and
+        every right-leaning segment shares one path, since they share their
+        stroke.  Each segment is its own M/L subpath, so nothing is joined.
+        
+        Toggles and endpoints are generated one grid row at a time, so peak
+        memory is O(tile_count).  The right-leaning path replays the same
+        toggles by restoring the Generator state saved before the first pass.
+        """
+        
+        if random_seed is not None:
+            self.rng = np.random.default_rng(random_seed)
+        
+        tile_size = self.width / tile_count
+        start_state = self.rng.bit_generator.state
+        row = np.empty((tile_count, 8), dtype=np.float64)
         
-        # Create SVG drawing
-        dwg = svgwrite.Drawing(filename, size=(self.width, self.height))
+        for flipped, color in ((False, color_left), (True, color_right)):
+            self.rng.bit_generator.state = start_state
+            opened = False
+            for grid_y in range(tile_count):
+                # One toggle per tile, then the endpoints of both segments per tile
+                toggles = self.rng.integers(0, 2, size=tile_count, dtype=np.uint8)
+                _fill_diagonals(grid_y, tile_size, toggles, row)
+                tiles = row[toggles.astype(bool) == flipped]
+                if not len(tiles):
+                    continue
+                
+                if not opened:
+                    yield '<path d="'
+                    opened = True
+                yield ''.join([
+                    f'M{x1},{y1}L{x2},{y2}M{x3},{y3}L{x4},{y4}'
+                    for x1, y1, x2, y2, x3, y3, x4, y4 in tiles.tolist()
+                ])
+            if opened:
+                yield f'" stroke="{color}" stroke-width="{stroke_weight}" fill="none"/>'
+    
+    def _iter_svg_chunks(self, tile_count=20, stroke_weight=8, random_seed=None):
+        """Yield a complete SVG pattern as a sequence of string chunks"""
+        
+        # Generate two random colors for this pattern
+        color_left, color_right = self.generate_random_colors(2)
         
-        # Add white background
-        dwg.add(dwg.rect(
-            insert=(0, 0),
-            size=(self.width, self.height),
-            fill='white'
-        ))
+        # SVG header and white background
+        yield _SVG_HEADER.format(w=self.width, h=self.height)
         
         # Generate the diagonal pattern
-        self.create_diagonal_pattern(
-            dwg, tile_count, stroke_weight, random_seed,
+        yield from self._iter_paths(
+            tile_count, stroke_weight, random_seed,
             color_left, color_right
         )
         
-        # Save the SVG
-        dwg.save()
+        yield _SVG_FOOTER
+    
+    def render_pattern(self, tile_count=20, stroke_weight=8, random_seed=None):
+        """Render a complete SVG pattern and return it as a string"""
+        return ''.join(self._iter_svg_chunks(tile_count, stroke_weight, random_seed))
+    
+    def generate_pattern(self, filename, tile_count=20, stroke_weight=8, random_seed=None):
+        """Generate a complete SVG pattern"""
+        # Stream the chunks straight to disk rather than building the file in memory
+        _write_file(filename, self._iter_svg_chunks(tile_count, stroke_weight, random_seed))
         print(f"Generated pattern: {filename}")
         return filename
 
 
+def _write_file(filename, chunks):
+    """Stream SVG chunks to filename with raw os.write calls
+
+    Chunks are coalesced into blocks of _WRITE_BLOCK characters, so any file
+    smaller than that still goes out in a single write syscall.
+    """
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        pending = []
+        pending_size = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= _WRITE_BLOCK:
+                _write_all(fd, ''.join(pending).encode('utf-8'))
+                pending = []
+                pending_size = 0
+        _write_all(fd, ''.join(pending).encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd, data):
+    """Write all of data to fd"""
+    # os.write may write less than asked for, so keep going until done
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _generate_one(task):
+    """Generate a single pattern file in a worker process"""
+    index, seed, size, tiles, stroke_weight, prefix, out_dir = task
+    
+    # Each pattern gets its own seed, so forked workers don't share a stream
+    generator = DiagonalPatternGenerator(width=size, height=size, seed=seed)
+    filename = out_dir / f"{prefix}_{index+1:03d}.svg"
+    generator.generate_pattern(
+        str(filename),
+        tile_count=tiles,
+        stroke_weight=stroke_weight
+    )
+    return filename
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate diagonal pattern SVG files')
     parser.add_argument('-n', '--num-patterns', type=int, default=5,
@@ -144,9 +350,6 @@ def main():
     
     args = parser.parse_args()
     
-    # Create generator
-    generator = DiagonalPatternGenerator(width=args.size, height=args.size)
-    
     # Get script directory
     script_dir = Path(__file__).parent
     
@@ -158,22 +361,22 @@ def main():
     print(f"Saving to: {script_dir}")
     print("-" * 50)
     
-    generated_files = []
+    tasks = []
     for i in range(args.num_patterns):
         # Use different seeds for each pattern if no specific seed provided
         if args.seed is not None:
             pattern_seed = args.seed + i
         else:
-            pattern_seed = None
-            
-        filename = script_dir / f"{args.prefix}_{i+1:03d}.svg"
-        generator.generate_pattern(
-            str(filename),
-            tile_count=args.tiles,
-            stroke_weight=args.stroke_weight,
-            random_seed=pattern_seed
+            pattern_seed = random.randrange(2**32)
+        tasks.append((i, pattern_seed, args.size, args.tiles,
+                      args.stroke_weight, args.prefix, script_dir))
+    
+    # Generate patterns in parallel, one process per core; each worker
+    # streams its own file to disk
+    with mp.Pool() as pool:
+        generated_files = sorted(
+            filename.name for filename in pool.imap_unordered(_generate_one, tasks)
         )
-        generated_files.append(filename.name)
     
     print("-" * 50)
     print(f"Successfully generated {len(generated_files)} patterns:")
@@ -8,56 +8,119 @@ Icons are saved in the same directory as the script.
 
 import random
 import colorsys
+import functools
 import os
 import argparse
-import math
+import multiprocessing as mp
 from pathlib import Path
+import numpy as np
 import svgwrite
 from svgwrite import rgb
 
 
+# Static SVG fragments, formatted directly instead of going through svgwrite
+_SVG_HEADER = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="{w}" height="{h}">\n'
+)
+_SVG_BACKGROUND = '<rect x="0" y="0" width="{w}" height="{h}" fill="{fill}" opacity="{opacity}"/>\n'
+_SVG_FOOTER = '</svg>\n'
+# Output is handed to os.write in blocks of about this many characters
+_WRITE_BLOCK = 1 << 16
+
+# Uniform draws consumed by RandomSVGIconGenerator._random_style
+_STYLE_DRAWS = 5
+# Largest random polygon, which needs one radius variation per side
+_MAX_POLYGON_SIDES = 8
+# Most shapes in an icon when the count is random
+_MAX_SHAPES = 8
+
+
+def _randint_from(u, low, high):
+    """Map a uniform draw in [0, 1) onto the integers low..high inclusive"""
+    if high < low:
+        # Same failure random.randint used to give, rather than a value out of range
+        raise ValueError(f"empty range for _randint_from: {low}..{high}")
+    return low + int(u * (high - low + 1))
+
+
 class RandomSVGIconGenerator:
-    def __init__(self, width=200, height=200, max_colors=4):
+    def __init__(self, width=200, height=200, max_colors=4, seed=None):
         self.width = width
         self.height = height
         self.max_colors = max_colors
+        # Shape bounds that only depend on the canvas size
+        self._min_dim_q = min(width, height) // 4
+        self._w_q = width // 4
+        self._h_q = height // 4
+        self._w_half = width // 2
+        self._h_half = height // 2
+        self.rng = np.random.default_rng(seed)
+        # Drawing used only as a factory for the shape elements.  Nothing is
+        # ever added to it, so one instance is shared by every icon.
+        self._template = svgwrite.Drawing(size=(width, height))
         self.colors = []
         self.shapes = ['circle', 'rectangle', 'triangle', 'polygon', 'ellipse']
+        # Bound shape constructors, keyed by shape name
+        self._shape_ctors = {name: getattr(self, f'create_{name}') for name in self.shapes}
         
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _polygon_trig(num_sides):
+        """(cos, sin) of num_sides evenly spaced vertex angles"""
+        angles = 2 * np.pi * np.arange(num_sides) / num_sides
+        return np.cos(angles), np.sin(angles)
+    
     def generate_color_palette(self):
         """Generate a random color palette with 1-4 colors"""
-        num_colors = random.randint(1, self.max_colors)
-        self.colors = []
+        # Palette size, base hue and every saturation/lightness in one call
+        max_colors = self.max_colors
+        u_count, base_hue, *u_colors = self.rng.random(2 + 2 * max_colors).tolist()
+        num_colors = _randint_from(u_count, 1, max_colors)
         
         # Generate colors with good contrast and variety
-        base_hue = random.random()
-        for i in range(num_colors):
-            # Vary hue while maintaining good saturation and lightness
-            hue = (base_hue + (i * 0.3)) % 1.0
-            saturation = random.uniform(0.6, 1.0)
-            lightness = random.uniform(0.3, 0.8)
-            
-            rgb_color = colorsys.hls_to_rgb(hue, lightness, saturation)
-            hex_color = '#{:02x}{:02x}{:02x}'.format(
-                int(rgb_color[0] * 255),
-                int(rgb_color[1] * 255),
-                int(rgb_color[2] * 255)
-            )
-            self.colors.append(hex_color)
+        u_sats = u_colors[:num_colors]
+        u_lights = u_colors[max_colors:max_colors + num_colors]
+        
+        hls_to_rgb = colorsys.hls_to_rgb
+        self.colors = [
+            '#' + bytes([int(c * 255) for c in hls_to_rgb(
+                # Vary hue while maintaining good saturation and lightness
+                (base_hue + i * 0.3) % 1.0, 0.3 + 0.5 * u_light, 0.6 + 0.4 * u_sat
+            )]).hex()
+            for i, (u_sat, u_light) in enumerate(zip(u_sats, u_lights))
+        ]
     
-    def get_random_color(self):
-        """Get a random color from the current palette"""
-        return random.choice(self.colors)
+    def get_random_color(self, u=None):
+        """Get a random color from the current palette
+        
+        u is an optional uniform draw in [0, 1) to pick with, so callers that
+        draw their randoms in bulk don't pay for another Generator call.
+        """
+        if u is None:
+            u = self.rng.random()
+        return self.colors[int(u * len(self.colors))]
+    
+    def _random_style(self, u_fill, u_flip, u_stroke, u_width, u_opacity):
+        """Turn five uniform draws into (fill, stroke, stroke_width, opacity)"""
+        fill_color = self.get_random_color(u_fill)
+        if u_flip < 0.5:
+            stroke_color = 'none'
+            stroke_width = 0
+        else:
+            stroke_color = self.get_random_color(u_stroke)
+            stroke_width = _randint_from(u_width, 1, 5)
+        return fill_color, stroke_color, stroke_width, 0.7 + 0.3 * u_opacity
     
     def create_circle(self, dwg):
         """Create a random circle"""
-        cx = random.randint(0, self.width)
-        cy = random.randint(0, self.height)
-        r = random.randint(10, min(self.width, self.height) // 4)
+        # All randoms for this shape in a single Generator call
+        ux, uy, ur, *style = self.rng.random(3 + _STYLE_DRAWS).tolist()
+        cx = _randint_from(ux, 0, self.width)
+        cy = _randint_from(uy, 0, self.height)
+        r = _randint_from(ur, 10, self._min_dim_q)
         
-        fill_color = self.get_random_color()
-        stroke_color = self.get_random_color() if random.choice([True, False]) else 'none'
-        stroke_width = random.randint(1, 5) if stroke_color != 'none' else 0
+        fill_color, stroke_color, stroke_width, opacity = self._random_style(*style)
         
         return dwg.circle(
             center=(cx, cy),
@@ -65,24 +128,24 @@ class RandomSVGIconGenerator:
             fill=fill_color,
             stroke=stroke_color,
             stroke_width=stroke_width,
-            opacity=random.uniform(0.7, 1.0)
+            opacity=opacity
         )
     
     def create_rectangle(self, dwg):
         """Create a random rectangle"""
-        x = random.randint(0, self.width // 2)
-        y = random.randint(0, self.height // 2)
-        width = random.randint(20, self.width - x)
-        height = random.randint(20, self.height - y)
+        # All randoms for this shape in a single Generator call
+        ux, uy, uw, uh, u_rotate, u_angle, *style = self.rng.random(6 + _STYLE_DRAWS).tolist()
+        x = _randint_from(ux, 0, self._w_half)
+        y = _randint_from(uy, 0, self._h_half)
+        width = _randint_from(uw, 20, self.width - x)
+        height = _randint_from(uh, 20, self.height - y)
         
-        fill_color = self.get_random_color()
-        stroke_color = self.get_random_color() if random.choice([True, False]) else 'none'
-        stroke_width = random.randint(1, 5) if stroke_color != 'none' else 0
+        fill_color, stroke_color, stroke_width, opacity = self._random_style(*style)
         
         # Optional rotation
         transform = ""
-        if random.choice([True, False]):
-            angle = random.randint(-45, 45)
+        if u_rotate >= 0.5:
+            angle = _randint_from(u_angle, -45, 45)
             center_x = x + width // 2
             center_y = y + height // 2
             transform = f"rotate({angle} {center_x} {center_y})"
@@ -93,7 +156,7 @@ class RandomSVGIconGenerator:
             fill=fill_color,
             stroke=stroke_color,
             stroke_width=stroke_width,
-            opacity=random.uniform(0.7, 1.0)
+            opacity=opacity
         )
         
         if transform:
@@ -103,66 +166,68 @@ class RandomSVGIconGenerator:
     
     def create_triangle(self, dwg):
         """Create a random triangle"""
-        points = []
-        for _ in range(3):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            points.append((x, y))
+        # All randoms for this shape in a single Generator call
+        ux1, uy1, ux2, uy2, ux3, uy3, *style = self.rng.random(6 + _STYLE_DRAWS).tolist()
+        points = [
+            (_randint_from(ux, 0, self.width), _randint_from(uy, 0, self.height))
+            for ux, uy in ((ux1, uy1), (ux2, uy2), (ux3, uy3))
+        ]
         
-        fill_color = self.get_random_color()
-        stroke_color = self.get_random_color() if random.choice([True, False]) else 'none'
-        stroke_width = random.randint(1, 5) if stroke_color != 'none' else 0
+        fill_color, stroke_color, stroke_width, opacity = self._random_style(*style)
         
         return dwg.polygon(
             points=points,
             fill=fill_color,
             stroke=stroke_color,
             stroke_width=stroke_width,
-            opacity=random.uniform(0.7, 1.0)
+            opacity=opacity
         )
     
     def create_polygon(self, dwg):
         """Create a random polygon (4-8 sides)"""
-        num_sides = random.randint(4, 8)
-        center_x = random.randint(50, self.width - 50)
-        center_y = random.randint(50, self.height - 50)
-        radius = random.randint(20, 80)
+        # All randoms for this shape in a single Generator call, with room
+        # for a radius variation per side at the largest side count
+        num_scalars = 4 + _STYLE_DRAWS
+        draws = self.rng.random(num_scalars + _MAX_POLYGON_SIDES)
+        u_sides, ux, uy, ur, *style = draws[:num_scalars].tolist()
+        u_radii = draws[num_scalars:]
+        num_sides = _randint_from(u_sides, 4, _MAX_POLYGON_SIDES)
+        center_x = _randint_from(ux, 50, self.width - 50)
+        center_y = _randint_from(uy, 50, self.height - 50)
+        radius = _randint_from(ur, 20, 80)
+        
+        cos_a, sin_a = self._polygon_trig(num_sides)
         
-        points = []
-        for i in range(num_sides):
-            angle = (2 * math.pi * i) / num_sides
-            radius_variation = random.uniform(0.7, 1.3)
-            x = center_x + radius * radius_variation * math.cos(angle)
-            y = center_y + radius * radius_variation * math.sin(angle)
-            points.append((x, y))
+        radii = radius * (0.7 + 0.6 * u_radii[:num_sides])
+        xs = center_x + radii * cos_a
+        ys = center_y + radii * sin_a
+        points = list(zip(xs.tolist(), ys.tolist()))
         
-        fill_color = self.get_random_color()
-        stroke_color = self.get_random_color() if random.choice([True, False]) else 'none'
-        stroke_width = random.randint(1, 5) if stroke_color != 'none' else 0
+        fill_color, stroke_color, stroke_width, opacity = self._random_style(*style)
         
         return dwg.polygon(
             points=points,
             fill=fill_color,
             stroke=stroke_color,
             stroke_width=stroke_width,
-            opacity=random.uniform(0.7, 1.0)
+            opacity=opacity
         )
     
     def create_ellipse(self, dwg):
         """Create a random ellipse"""
-        cx = random.randint(0, self.width)
-        cy = random.randint(0, self.height)
-        rx = random.randint(15, self.width // 4)
-        ry = random.randint(15, self.height // 4)
+        # All randoms for this shape in a single Generator call
+        ux, uy, urx, ury, u_rotate, u_angle, *style = self.rng.random(6 + _STYLE_DRAWS).tolist()
+        cx = _randint_from(ux, 0, self.width)
+        cy = _randint_from(uy, 0, self.height)
+        rx = _randint_from(urx, 15, self._w_q)
+        ry = _randint_from(ury, 15, self._h_q)
         
-        fill_color = self.get_random_color()
-        stroke_color = self.get_random_color() if random.choice([True, False]) else 'none'
-        stroke_width = random.randint(1, 5) if stroke_color != 'none' else 0
+        fill_color, stroke_color, stroke_width, opacity = self._random_style(*style)
         
         # Optional rotation
         transform = ""
-        if random.choice([True, False]):
-            angle = random.randint(0, 180)
+        if u_rotate >= 0.5:
+            angle = _randint_from(u_angle, 0, 180)
             transform = f"rotate({angle} {cx} {cy})"
         
         ellipse = dwg.ellipse(
@@ -171,7 +236,7 @@ class RandomSVGIconGenerator:
             fill=fill_color,
             stroke=stroke_color,
             stroke_width=stroke_width,
-            opacity=random.uniform(0.7, 1.0)
+            opacity=opacity
         )
         
         if transform:
@@ -181,50 +246,107 @@ class RandomSVGIconGenerator:
     
     def create_shape(self, dwg, shape_type):
         """Create a shape based on the specified type"""
-        shape_methods = {
-            'circle': self.create_circle,
-            'rectangle': self.create_rectangle,
-            'triangle': self.create_triangle,
-            'polygon': self.create_polygon,
-            'ellipse': self.create_ellipse
-        }
-        
-        return shape_methods[shape_type](dwg)
+        return self._shape_ctors[shape_type](dwg)
     
-    def generate_icon(self, filename, num_shapes=None):
-        """Generate a complete SVG icon"""
-        # Create SVG drawing
-        dwg = svgwrite.Drawing(filename, size=(self.width, self.height))
+    def _iter_svg_chunks(self, num_shapes=None, random_seed=None):
+        """Yield a complete SVG icon as a sequence of string chunks"""
+        if random_seed is not None:
+            self.rng = np.random.default_rng(random_seed)
+        
+        dwg = self._template
+        # Constructors for the enabled shape types, looked up once per icon
+        ctors = [self._shape_ctors[name] for name in self.shapes]
         
         # Generate color palette
         self.generate_color_palette()
         
+        # Background and shape choices in a single Generator call: background
+        # flip, color and opacity, shape count, then one pick per shape
+        max_shapes = _MAX_SHAPES if num_shapes is None else num_shapes
+        u_bg, u_bg_color, u_bg_opacity, u_count, *picks = self.rng.random(4 + max_shapes).tolist()
+        
+        yield _SVG_HEADER.format(w=self.width, h=self.height)
+        
         # Random background (sometimes)
-        if random.choice([True, False]):
-            bg_color = self.get_random_color()
-            dwg.add(dwg.rect(
-                insert=(0, 0),
-                size=(self.width, self.height),
-                fill=bg_color,
-                opacity=random.uniform(0.1, 0.3)
-            ))
+        if u_bg >= 0.5:
+            yield _SVG_BACKGROUND.format(
+                w=self.width,
+                h=self.height,
+                fill=self.get_random_color(u_bg_color),
+                opacity=0.1 + 0.2 * u_bg_opacity
+            )
         
         # Determine number of shapes
         if num_shapes is None:
-            num_shapes = random.randint(2, 8)
+            num_shapes = _randint_from(u_count, 2, _MAX_SHAPES)
         
-        # Generate shapes
-        for _ in range(num_shapes):
-            shape_type = random.choice(self.shapes)
-            shape = self.create_shape(dwg, shape_type)
-            dwg.add(shape)
-        
-        # Save the SVG
-        dwg.save()
+        # Generate shapes, collected in one group so ElementTree serializes
+        # them in a single pass rather than once per shape
+        group = dwg.g()
+        for pick in picks[:num_shapes]:
+            group.add(ctors[int(pick * len(ctors))](dwg))
+        yield group.tostring()
+
+        yield _SVG_FOOTER
+    
+    def render_icon(self, num_shapes=None, random_seed=None):
+        """Render a complete SVG icon and return it as a string"""
+        return ''.join(self._iter_svg_chunks(num_shapes, random_seed))
+    
+    def generate_icon(self, filename, num_shapes=None, random_seed=None):
+        """Generate a complete SVG icon"""
+        # Stream the chunks straight to disk rather than building the file in memory
+        _write_file(filename, self._iter_svg_chunks(num_shapes, random_seed))
         print(f"Generated icon: {filename}")
         return filename
 
 
+def _write_file(filename, chunks):
+    """Stream SVG chunks to filename with raw os.write calls
+
+    Chunks are coalesced into blocks of _WRITE_BLOCK characters, so any file
+    smaller than that still goes out in a single write syscall.
+    """
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        pending = []
+        pending_size = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= _WRITE_BLOCK:
+                _write_all(fd, ''.join(pending).encode('utf-8'))
+                pending = []
+                pending_size = 0
+        _write_all(fd, ''.join(pending).encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd, data):
+    """Write all of data to fd"""
+    # os.write may write less than asked for, so keep going until done
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _generate_one(task):
+    """Generate a single icon file in a worker process"""
+    index, seed, size, max_colors, num_shapes, prefix, out_dir = task
+    
+    # Each icon gets its own seed, so forked workers don't share a stream
+    generator = RandomSVGIconGenerator(
+        width=size,
+        height=size,
+        max_colors=max_colors,
+        seed=seed
+    )
+    filename = out_dir / f"{prefix}_{index+1:03d}.svg"
+    generator.generate_icon(str(filename), num_shapes)
+    return filename
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate random geometric SVG icons')
     parser.add_argument('-n', '--num-icons', type=int, default=5, 
@@ -240,13 +362,6 @@ def main():
     
     args = parser.parse_args()
     
-    # Create generator
-    generator = SVGIconGenerator(
-        width=args.size, 
-        height=args.size, 
-        max_colors=args.max_colors
-    )
-    
     # Get script directory
     script_dir = Path(__file__).parent
     
@@ -257,11 +372,18 @@ def main():
     print(f"Saving to: {script_dir}")
     print("-" * 40)
     
-    generated_files = []
-    for i in range(args.num_icons):
-        filename = script_dir / f"{args.prefix}_{i+1:03d}.svg"
-        generator.generate_icon(str(filename), args.shapes)
-        generated_files.append(filename.name)
+    tasks = [
+        (i, random.randrange(2**32), args.size, args.max_colors,
+         args.shapes, args.prefix, script_dir)
+        for i in range(args.num_icons)
+    ]
+    
+    # Generate icons in parallel, one process per core; each worker
+    # streams its own file to disk
+    with mp.Pool() as pool:
+        generated_files = sorted(
+            filename.name for filename in pool.imap_unordered(_generate_one, tasks)
+        )
     
     print("-" * 40)
     print(f"Successfully generated {len(generated_files)} icons:")